@@ -1,22 +1,28 @@
 import argparse
 import asyncio
-import json
-import os
 import signal
 import sys
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
+from openai import omit
 
 import tools
 from config import Agent, load_config
 from runtime_events import emit_event
 from tools.context import OUTPUT_DIR, get_context
+from tools.openai_client import get_client
 from tools.toolbox import ToolBox
 from tools.transcription import load_audio_file
 from tools.translation import SUPPORTED_LANGUAGES, parse_language, run_translation
 
+try:
+    # uvloop is a faster drop-in event loop, but it isn't available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
 load_dotenv()
 
 VERBOSE = False
@@ -26,20 +32,23 @@ def print_verbose(*args, **kwargs):
     if VERBOSE:
         print(*args, **kwargs, flush=True)
 
-client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+client = get_client()
 tool_box = ToolBox()
 ctx = get_context()
 
 def _format_final_package(message: str) -> str | None:
     """Return final user-facing text when `message` is a completed package."""
-    # Try to read the message as JSON.
-    try:
-        payload = json.loads(message)
-    except (TypeError, json.JSONDecodeError):
+    # Most messages are plain text, so only try to parse ones that look like a JSON object.
+    if not isinstance(message, str):
+        return None
+    stripped = message.strip()
+    if not (stripped.startswith("{") and stripped.endswith("}")):
         return None
 
-    # If this is not a JSON object, it is not a finished package.
-    if not isinstance(payload, dict):
+    # Try to read the message as JSON.
+    try:
+        payload = orjson.loads(stripped)
+    except orjson.JSONDecodeError:
         return None
 
     transcription = payload.get("transcription")
@@ -83,7 +92,6 @@ async def get_transcript() -> str:
     return transcript
 
 tool_box.tool(get_transcript)
-tools.register_all_tools(tool_box)
 
 def add_agent_tools(agents: dict[str, Agent], tool_box: ToolBox):
     def make_agent_tool(agent: Agent):
@@ -111,6 +119,17 @@ def add_agent_tools(agents: dict[str, Agent], tool_box: ToolBox):
         tool_box.tool(make_agent_tool(agent))
 
 
+async def _run_function_call(agent: Agent, tool_box: ToolBox, item) -> dict[str, str]:
+    """Run one function_call item and return its function_call_output entry."""
+    print_verbose(f"---- {agent['name']} calling {item.name} ----")
+    result = await tool_box.run_tool(item.name, **orjson.loads(item.arguments))
+    return {
+        "type": "function_call_output",
+        "call_id": item.call_id,
+        "output": orjson.dumps(result).decode(),
+    }
+
+
 async def run_agent(agent: Agent, tool_box: ToolBox, message: str | None):
     print_verbose("")
     print_verbose(f"---- RUNNING {agent['name']} ----")
@@ -118,37 +137,42 @@ async def run_agent(agent: Agent, tool_box: ToolBox, message: str | None):
         print_verbose(message)
         print_verbose("----------------------------------")
 
-    history = [{"role": "system", "content": agent["prompt"]}]
+    # The responses API stores each turn server-side, so later turns only send the new tool
+    # outputs and point at the previous response instead of resending the whole history.
+    # Agents that opt out of storage with `store: false` keep resending the full history.
+    continue_on_server = agent.get("kwargs", {}).get("store", True)
+    previous_response_id = omit
+
+    turn_input = [{"role": "system", "content": agent["prompt"]}]
     if message is not None:
-        history.append({"role": "user", "content": message})
+        turn_input.append({"role": "user", "content": message})
 
     tools = tool_box.get_tools(agent["tools"])
 
     while True:
         response = await client.responses.create(
-            input=history,
+            input=turn_input,
+            previous_response_id=previous_response_id,
             model=agent.get("model", "gpt-5-mini"),
             tools=tools,
             **agent.get("kwargs", {}),
         )
 
-        history += response.output
+        if continue_on_server:
+            previous_response_id = response.id
+            turn_input = []
+        else:
+            turn_input += response.output
 
+        function_calls = []
+        final_text = None
         for item in response.output:
             if item.type == "function_call":
-                print_verbose(f"---- {agent['name']} calling {item.name} ----")
-                result = await tool_box.run_tool(item.name, **json.loads(item.arguments))
-
-                history.append(
-                    {
-                        "type": "function_call_output",
-                        "call_id": item.call_id,
-                        "output": json.dumps(result),
-                    }
-                )
+                function_calls.append(item)
 
             elif item.type == "message":
-                return response.output_text
+                final_text = response.output_text
+                break
 
             elif item.type == "reasoning":
                 print_verbose(f"---- {agent['name']} REASONED ----")
@@ -156,6 +180,21 @@ async def run_agent(agent: Agent, tool_box: ToolBox, message: str | None):
             else:
                 print_verbose(item, file=sys.stderr)
 
+        # Agents that opt in with `parallel_tools` run this turn's tool calls concurrently.
+        # Only async tools actually overlap: ToolBox.run_tool runs sync tools inline on the
+        # event loop, so they still run one after another. gather() keeps the call order.
+        # Neither agent in agents.yaml sets it: their tools depend on each other's results.
+        if agent.get("parallel_tools"):
+            outputs = await asyncio.gather(
+                *(_run_function_call(agent, tool_box, item) for item in function_calls)
+            )
+        else:
+            outputs = [await _run_function_call(agent, tool_box, item) for item in function_calls]
+        turn_input += outputs
+
+        if final_text is not None:
+            return final_text
+
 def validate_audio_path(path: Path) -> bool:
     if not path.exists():
         print(f"Error: Path '{path}' does not exist")
@@ -201,6 +240,8 @@ async def async_main(audio_path: Path, translate_lang: str | None = None, mode:
 
     config = load_config(Path("agents.yaml"))
     agents = {agent["name"]: agent for agent in config["agents"]}
+    # Only register the tools that some agent in the config can call
+    tools.register_all_tools(tool_box, {name for agent in agents.values() for name in agent["tools"]})
     add_agent_tools(agents, tool_box)
     if mode == "auto":
         main_agent=config.get("automated", config["main"])
@@ -215,7 +256,8 @@ async def async_main(audio_path: Path, translate_lang: str | None = None, mode:
 def main(audio_path: Path, translate_lang: str | None = None, mode: str = "interactive"):
     if not validate_audio_path(audio_path):
         sys.exit(1)
-    asyncio.run(async_main(audio_path, translate_lang, mode))
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    asyncio.run(async_main(audio_path, translate_lang, mode), loop_factory=loop_factory)
 
 
 if __name__ == "__main__":
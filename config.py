@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class Agent(TypedDict):
@@ -9,6 +9,8 @@ class Agent(TypedDict):
     model: str
     tools: list[str]
     kwargs: dict | None
+    # Opt-in, see run_agent in agent.py
+    parallel_tools: NotRequired[bool]
 
 
 class Config(TypedDict):
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import threading
 from difflib import SequenceMatcher
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -7,6 +9,9 @@ import pytest
 
 from agent import _format_final_package, run_agent, tool_box
 from config import load_config
+from tools import register_all_tools, tool
+from tools.coordinator_tools import talk_to_user
+from tools.toolbox import ToolBox
 from tools.transcription import load_audio_file
 
 base_dir = Path(__file__).resolve().parents[1]
@@ -52,7 +57,7 @@ async def run_and_get_called_tools(
     return [call.args[0] for call in mock_run.call_args_list]
 
 
-def test_deterministic_output_for_audio_file():
+def test_deterministic_output_for_audio_file(tmp_path, monkeypatch):
     """
     The idea of this test is that it compares an output generated by the transcriber to an expected
     output. Based on research, it doesn't look like whisper models can be trusted to provide an exact
@@ -63,6 +68,8 @@ def test_deterministic_output_for_audio_file():
     It also felt most natural to me to move the audio file into this folder for the purposes of the
     test, we can decide whether to remove it from the other place or just leave it in both.
     """
+    # Use an empty transcript cache so the model really runs
+    monkeypatch.setattr("tools.transcription.CACHE_DIR", tmp_path)
     audio_path = base_dir / "tests" / "audio" / "test.mp3"
 
     result = load_audio_file(str(audio_path))
@@ -90,6 +97,10 @@ def test_format_final_package_invalid_missing_summary():
     assert _format_final_package(payload) is None
 
 
+def test_format_final_package_plain_text():
+    assert _format_final_package("Summarize with 5 bullets") is None
+
+
 def make_tool_call_response(name, arguments, call_id="call_1"):
     """Helper to build a fake LLM response that calls a tool."""
     item = MagicMock()
@@ -143,3 +154,119 @@ async def test_coordinator_delegates_to_cleaner(mock_openai, coordinator_agent):
     # Coordinator must NOT call get_transcript directly
     assert "get_transcript" not in called_tools
 
+
+async def test_parallel_tools_keep_call_order(mock_openai, cleaner_agent):
+    first = make_tool_call_response("get_context_snapshot", {}, call_id="call_1").output[0]
+    second = make_tool_call_response("get_transcript", {}, call_id="call_2").output[0]
+    response = MagicMock()
+    response.output = [first, second]
+    mock_openai.responses.create.side_effect = [response, make_text_response()]
+
+    await run_and_get_called_tools({**cleaner_agent, "parallel_tools": True}, tool_box, return_value="ok")
+
+    second_turn_input = mock_openai.responses.create.call_args_list[1].kwargs["input"]
+    call_ids = [
+        entry["call_id"]
+        for entry in second_turn_input
+        if isinstance(entry, dict) and entry.get("type") == "function_call_output"
+    ]
+    assert call_ids == ["call_1", "call_2"]
+
+
+async def test_parallel_tools_run_concurrently(mock_openai):
+    # Each tool only finishes once the other one has started, so a sequential run would time out
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+    parallel_box = ToolBox()
+
+    async def first_tool() -> str:
+        """First tool."""
+        first_started.set()
+        await asyncio.wait_for(second_started.wait(), timeout=1)
+        return "first done"
+
+    async def second_tool() -> str:
+        """Second tool."""
+        second_started.set()
+        await asyncio.wait_for(first_started.wait(), timeout=1)
+        return "second done"
+
+    parallel_box.tool(first_tool)
+    parallel_box.tool(second_tool)
+
+    response = MagicMock()
+    response.output = [
+        make_tool_call_response("first_tool", {}, call_id="call_1").output[0],
+        make_tool_call_response("second_tool", {}, call_id="call_2").output[0],
+    ]
+    mock_openai.responses.create.side_effect = [response, make_text_response()]
+    agent = {"name": "parallel", "prompt": "", "tools": ["first_tool", "second_tool"], "parallel_tools": True}
+
+    await run_agent(agent, parallel_box, None)
+
+    second_turn_input = mock_openai.responses.create.call_args_list[1].kwargs["input"]
+    assert [json.loads(entry["output"]) for entry in second_turn_input] == ["first done", "second done"]
+
+
+async def test_followup_turns_continue_from_previous_response(mock_openai, cleaner_agent):
+    first_turn = make_tool_call_response("get_transcript", {})
+    first_turn.id = "resp_1"
+    mock_openai.responses.create.side_effect = [first_turn, make_text_response()]
+
+    await run_and_get_called_tools(cleaner_agent, tool_box, return_value="Raw transcript.")
+
+    second_call = mock_openai.responses.create.call_args_list[1].kwargs
+    assert second_call["previous_response_id"] == "resp_1"
+    # Only the new tool output is sent, not the system prompt or earlier turns
+    assert [entry["type"] for entry in second_call["input"]] == ["function_call_output"]
+
+
+async def test_talk_to_user_keeps_event_loop_running():
+    release = threading.Event()
+
+    def fake_input(prompt):
+        # Only answers once another task has run on the event loop while the prompt is open
+        release.wait(timeout=1)
+        return "Five bullets, please." if release.is_set() else "event loop was blocked"
+
+    async def other_task():
+        release.set()
+
+    with patch("builtins.input", side_effect=fake_input):
+        reply, _ = await asyncio.gather(talk_to_user("How many bullets?"), other_task())
+
+    assert reply == "Five bullets, please."
+
+
+async def test_talk_to_user_propagates_input_errors():
+    with patch("builtins.input", side_effect=EOFError):
+        with pytest.raises(EOFError):
+            await talk_to_user("Anyone there?")
+
+
+def test_register_all_tools_only_registers_requested_tools():
+    all_tool_names = [
+        "get_raw_transcript",
+        "set_cleaned_transcript",
+        "set_summary",
+        "get_context_snapshot",
+        "talk_to_user",
+    ]
+    full_box = ToolBox()
+    register_all_tools(full_box)
+    assert sorted(schema["name"] for schema in full_box.get_tools(all_tool_names)) == sorted(all_tool_names)
+
+    filtered_box = ToolBox()
+    register_all_tools(filtered_box, {"set_summary"})
+    assert [schema["name"] for schema in filtered_box.get_tools(all_tool_names)] == ["set_summary"]
+
+
+def test_tool_rejects_duplicate_names():
+    # Make sure the real set_summary from cleaner_tools is already in the registry
+    register_all_tools(ToolBox())
+
+    def set_summary(bullets_json: str) -> str:
+        return "ok"
+
+    with pytest.raises(ValueError, match="Duplicate tool name 'set_summary'"):
+        tool(set_summary)
@@ -1,28 +1,42 @@
 """
 This file registers the tool directory as an importable package and
-provides a method for agent.py to register all functions from *_tools.py files.
+provides a method for agent.py to register all @tool functions from *_tools.py files.
 """
 
 import importlib
-import inspect
 from pathlib import Path
+from typing import Callable
 
 VERBOSE = False
 
+# Functions marked with @tool, filled in as each *_tools.py module is imported
+_TOOLS: dict[str, Callable] = {}
+
 def print_verbose(*args, **kwargs):
     """Print only when --verbose flag is set."""
     if VERBOSE:
         print(*args, **kwargs, flush=True)
 
-def register_all_tools(tool_box):
-    tools_dir = Path(__file__).parent
-    tool_modules = tools_dir.glob("*_tools.py")
+def tool(func):
+    """Mark a function in a *_tools.py module as an agent tool."""
+    existing = _TOOLS.get(func.__name__)
+    if existing is not None:
+        raise ValueError(
+            f"Duplicate tool name {func.__name__!r}: defined in both {existing.__module__} and {func.__module__}"
+        )
+    _TOOLS[func.__name__] = func
+    return func
 
-    for module_path in tool_modules:
-        module_name = module_path.stem
-        module = importlib.import_module(f"tools.{module_name}")
+def register_all_tools(tool_box, tool_names: set[str] | None = None):
+    """Register the @tool functions from *_tools.py files.
+
+    If *tool_names* is given, only the tools some agent actually lists are registered.
+    """
+    tools_dir = Path(__file__).parent
+    for module_path in tools_dir.glob("*_tools.py"):
+        # Importing the module runs its @tool decorators
+        importlib.import_module(f"tools.{module_path.stem}")
 
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
-            # Skip private functions and imported functions
-            if not name.startswith('_') and obj.__module__ == module.__name__:
-                tool_box.tool(obj)
+    for name, func in _TOOLS.items():
+        if tool_names is None or name in tool_names:
+            tool_box.tool(func)
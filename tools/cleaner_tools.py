@@ -1,14 +1,17 @@
 import json
 from typing import Optional
 
+from tools import tool
 from tools.context import get_context
 
 
+@tool
 def get_raw_transcript() -> str:
     """Return the raw transcript from the shared context. Blocks until available."""
     return get_context().get_raw_transcript()
 
 
+@tool
 def set_cleaned_transcript(text: str) -> str:
     """Store the cleaned transcript in the shared context.
 
@@ -21,6 +24,7 @@ def set_cleaned_transcript(text: str) -> str:
     return "ok"
 
 
+@tool
 def set_summary(bullets_json: str, n_bullets: Optional[int]) -> str:
     """Store summary bullet points in the shared context.
 
@@ -54,6 +58,7 @@ def set_summary(bullets_json: str, n_bullets: Optional[int]) -> str:
     return "ok"
 
 
+@tool
 def get_context_snapshot() -> str:
     """Return the full shared context (raw transcript, cleaned transcript, summary, metadata) as JSON."""
     return get_context().snapshot_json()
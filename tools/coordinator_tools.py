@@ -1,7 +1,39 @@
+import asyncio
+import threading
+
 from runtime_events import emit_event
+from tools import tool
+
+
+async def _read_input(prompt: str) -> str:
+    """Wait for a line of user input without blocking the event loop."""
+    # asyncio.to_thread would use the loop's executor, whose worker threads are joined at exit,
+    # so a pending input() would stop Ctrl+C from ending the process. A daemon thread doesn't.
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(result: str | None, exc: Exception | None) -> None:
+        if future.cancelled():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
 
+    def read():
+        try:
+            result = input(prompt)
+        except Exception as exc:
+            loop.call_soon_threadsafe(deliver, None, exc)
+        else:
+            loop.call_soon_threadsafe(deliver, result, None)
 
-def talk_to_user(message: str) -> str:
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+@tool
+async def talk_to_user(message: str) -> str:
     """Send a message to the user and get the user's response.
 
     This is the ONLY way to communicate with the user,
@@ -12,5 +44,4 @@ def talk_to_user(message: str) -> str:
     emit_event("user_message", message=message)
     print()
     print("AI: ", message)
-    return input("User: ")
-
+    return await _read_input("User: ")
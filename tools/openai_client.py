@@ -0,0 +1,26 @@
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# The agents sit idle for a while between requests (waiting on the user or on transcription),
+# so idle connections are kept open longer than httpx's 5 second default to skip new TLS handshakes.
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+KEEPALIVE_EXPIRY = 60.0
+
+_CLIENT: AsyncOpenAI | None = None
+
+
+def get_client() -> AsyncOpenAI:
+    """Return the AsyncOpenAI client shared by the agents and tools."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = AsyncOpenAI(
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            ),
+        )
+    return _CLIENT
@@ -1,4 +1,7 @@
+import hashlib
 import os
+import tempfile
+from pathlib import Path
 
 from faster_whisper import WhisperModel
 
@@ -7,7 +10,32 @@ from tools import print_verbose
 MODEL_NAME = "base"
 DEVICE = "cpu"
 COMPUTE_TYPE = "int8"
-BEAM_SIZE = 5
+# Greedy decoding is close to beam search in accuracy at a fraction of the cost.
+# Raise this when accuracy matters more than speed.
+BEAM_SIZE = 1
+
+
+def _available_cpus() -> int:
+    # sched_getaffinity respects CPU pinning (e.g. docker --cpuset-cpus), cpu_count() is every host CPU
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 0
+
+
+# CTranslate2 only uses 4 threads on CPU by default, so let it use every core we're allowed to run on
+CPU_THREADS = _available_cpus()
+
+TRANSCRIBE_OPTIONS = {
+    "beam_size": BEAM_SIZE,
+    # Skip silent stretches instead of decoding them
+    "vad_filter": True,
+    "vad_parameters": {"min_silence_duration_ms": 500},
+}
+
+# Finished transcripts are cached here, keyed by the audio contents and the settings above
+CACHE_DIR = Path(
+    os.getenv("TRANSCRIPT_CACHE_DIR", Path.home() / ".cache" / "ai-audio-transcriber" / "transcription")
+)
 
 _MODEL: WhisperModel | None = None
 
@@ -18,29 +46,59 @@ def _get_model() -> WhisperModel:
         print_verbose(
             f"[transcription] loading whisper model {MODEL_NAME!r} on {DEVICE}/{COMPUTE_TYPE}"
         )
-        _MODEL = WhisperModel(MODEL_NAME, device=DEVICE, compute_type=COMPUTE_TYPE)
+        _MODEL = WhisperModel(MODEL_NAME, device=DEVICE, compute_type=COMPUTE_TYPE, cpu_threads=CPU_THREADS)
     return _MODEL
 
 
+def _cache_path(file_path: str) -> Path:
+    with open(file_path, "rb") as f:
+        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+    # Include the settings so changing the model or decoding options doesn't return a stale transcript
+    digest.update(f"{MODEL_NAME}|{COMPUTE_TYPE}|{TRANSCRIBE_OPTIONS}".encode())
+    return CACHE_DIR / f"{digest.hexdigest()}.txt"
+
+
+def _write_cache(cache_path: Path, transcript: str) -> None:
+    # Write to a temp file and rename it into place, so a crash or a concurrent run
+    # can never leave a truncated transcript behind under the final name
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    except OSError as e:
+        print_verbose(f"[transcription] could not write cache: {e}")
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(transcript)
+        os.replace(tmp_name, cache_path)
+    except OSError as e:
+        print_verbose(f"[transcription] could not write cache: {e}")
+        Path(tmp_name).unlink(missing_ok=True)
+
+
 def load_audio_file(file_path: str) -> str:
     if not os.path.exists(file_path):
         return f"Error: File not found at {file_path}"
 
     try:
+        cache_path = _cache_path(file_path)
+        if cache_path.exists():
+            print_verbose(f"[transcription] using cached transcript {cache_path}")
+            return cache_path.read_text(encoding="utf-8")
+
         model = _get_model()
         print_verbose(f"[transcription] using model={MODEL_NAME!r}")
-        segments, _ = model.transcribe(
-            file_path,
-            beam_size=BEAM_SIZE,
-        )
+        segments, _ = model.transcribe(file_path, **TRANSCRIBE_OPTIONS)
 
         full_transcript = []
         for segment in segments:
             text = segment.text.strip()
             full_transcript.append(text)
 
-
-        return " ".join(full_transcript)
+        transcript = " ".join(full_transcript)
+        _write_cache(cache_path, transcript)
+        return transcript
 
     except Exception as e:
         return f"Transcription error: {str(e)}"
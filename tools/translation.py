@@ -4,12 +4,11 @@ import asyncio
 import sys
 from pathlib import Path
 
-from openai import AsyncOpenAI
-
 from runtime_events import emit_event
 from tools import print_verbose
 from tools.context import get_context
 from tools.exporters import write_outputs
+from tools.openai_client import get_client
 
 # Supported translation languages, we can change this if we want
 SUPPORTED_LANGUAGES: dict[str, str] = {
@@ -59,9 +58,7 @@ async def translate_text(
         f"with no commentary or explanation."
     )
 
-    client = AsyncOpenAI()
-
-    response = await client.chat.completions.create(
+    response = await get_client().chat.completions.create(
         # This model seems to do better with translation than gpt-5-mini, which is the default elsewhere
         model="gpt-5.4-mini",
         messages=[